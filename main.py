@@ -1,16 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import asyncio
+import functools
+import hashlib
+import io
+import itertools
 import json
+import mmap
 import os
-import threading
-import time
+import tempfile
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from PIL import Image, ImageTk
-import cv2
+import aiofiles
 
 # Install required packages:
-# pip install pillow opencv-python customtkinter
+# pip install pillow opencv-python aiofiles customtkinter
 
 try:
     import customtkinter as ctk
@@ -20,6 +26,88 @@ except ImportError:
     print("CustomTkinter not available. Install with: pip install customtkinter")
     CTK_AVAILABLE = False
 
+# Store passwords in the system keyring when available
+try:
+    import keyring
+    from keyring.errors import KeyringError, PasswordDeleteError
+
+    KEYRING_AVAILABLE = True
+except ImportError:
+    KEYRING_AVAILABLE = False
+
+KEYRING_SERVICE = "autopost-instagram"
+
+# Faster config serialization when orjson is installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=4, sort_keys=True).encode()
+
+    _loads = json.loads
+
+# Faster duplicate detection when xxhash is installed
+try:
+    import xxhash
+
+    _hash_bytes = xxhash.xxh3_64
+except ImportError:
+    _hash_bytes = hashlib.blake2b
+
+# Maximum number of videos uploaded at the same time
+MAX_CONCURRENT_UPLOADS = 4
+
+# Videos are streamed in chunks of this size instead of being read into memory
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Duration of the simulated transfer of one video
+SIMULATED_UPLOAD_SECONDS = 5
+
+# Time the asyncio loop runs between rounds of Tk event processing
+LOOP_SLICE_MS = 15
+
+# Interval between asyncio loop passes while no task is running
+LOOP_IDLE_MS = 50
+
+# Progress bar redraw interval (~30 Hz)
+PROGRESS_INTERVAL_MS = 33
+
+# Status bar messages are coalesced into one redraw per interval (~20 Hz)
+STATUS_INTERVAL_MS = 50
+
+# Size of the thumbnails shown in the video queue
+THUMBNAIL_SIZE = (160, 90)
+
+# Decoded thumbnails are kept here between runs
+THUMBNAIL_CACHE_DIR = Path.home() / ".cache" / "autopost"
+
+
+def _atomic_write(path, data):
+    """Write bytes to a file via a temp file, so a crash never leaves it truncated"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _fast_hash(path):
+    """Hash a file's contents through a memory map"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _hash_bytes(b'').hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return _hash_bytes(m).hexdigest()
+
 
 class ModernSocialMediaGUI:
     def __init__(self):
@@ -32,22 +120,61 @@ class ModernSocialMediaGUI:
             self.root = tk.Tk()
             self.setup_ttk_styles()
 
+        # Widget classes used by the create_* helpers
+        if CTK_AVAILABLE:
+            self._Frame = ctk.CTkFrame
+            # CustomTkinter widgets have no ttk style option
+            self._Label = lambda parent, style=None, **kwargs: ctk.CTkLabel(parent, **kwargs)
+            self._Button = lambda parent, style=None, **kwargs: ctk.CTkButton(parent, **kwargs)
+            self._Entry = ctk.CTkEntry
+            self._Text = ctk.CTkTextbox
+        else:
+            self._Frame = functools.partial(ttk.Frame, relief="solid", borderwidth=1)
+            self._Label = ttk.Label
+            self._Button = ttk.Button
+            self._Entry = ttk.Entry
+            self._Text = functools.partial(tk.Text, font=('Helvetica', 10))
+
         self.root.title("Social Media Auto-Poster")
         self.root.geometry("1200x800")
         self.root.minsize(1000, 600)
 
         # Data storage
-        self.videos = []
+        self.videos = {}
         self.current_video = None
+        self._video_ids = itertools.count(1)
+        self._pending = set()
+        self._seen_hashes = set()
+        self._thumb_images = {}
+        self._status_pending = None
+        self._status_scheduled = False
+        self._active_uploads = {}
+        self._progress_videos = {}
+        self._progress_scheduled = False
         self.credentials = {
             'youtube': {'client_id': '', 'client_secret': '', 'authenticated': False},
             'instagram': {'username': '', 'password': '', 'authenticated': False}
         }
+        self._config_hash = None
+        self._keyring_password = None
+        self._keyring_usable = KEYRING_AVAILABLE
+
+        # Event loop for uploads, driven from Tk's mainloop (see _pump_loop)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._upload_sem = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+        self._tasks = set()
+
+        # Worker pool for thumbnail decoding (cv2 releases the GIL while decoding)
+        self._thumb_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
 
         # Create UI
         self.create_widgets()
         self.load_config()
 
+        # Stop background workers when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self._shutdown)
+
     def setup_ttk_styles(self):
         """Setup modern styles for standard tkinter"""
         style = ttk.Style()
@@ -85,42 +212,23 @@ class ModernSocialMediaGUI:
 
     def create_frame(self, parent, **kwargs):
         """Create a frame with modern styling"""
-        if CTK_AVAILABLE:
-            return ctk.CTkFrame(parent, **kwargs)
-        else:
-            frame = ttk.Frame(parent, **kwargs)
-            frame.configure(relief="solid", borderwidth=1)
-            return frame
+        return self._Frame(parent, **kwargs)
 
     def create_label(self, parent, text, style=None, **kwargs):
         """Create a label with modern styling"""
-        if CTK_AVAILABLE:
-            return ctk.CTkLabel(parent, text=text, **kwargs)
-        else:
-            return ttk.Label(parent, text=text, style=style, **kwargs)
+        return self._Label(parent, text=text, style=style, **kwargs)
 
     def create_button(self, parent, text, command=None, style=None, **kwargs):
         """Create a button with modern styling"""
-        if CTK_AVAILABLE:
-            return ctk.CTkButton(parent, text=text, command=command, **kwargs)
-        else:
-            return ttk.Button(parent, text=text, command=command, style=style, **kwargs)
+        return self._Button(parent, text=text, command=command, style=style, **kwargs)
 
     def create_entry(self, parent, **kwargs):
         """Create an entry with modern styling"""
-        if CTK_AVAILABLE:
-            return ctk.CTkEntry(parent, **kwargs)
-        else:
-            return ttk.Entry(parent, **kwargs)
+        return self._Entry(parent, **kwargs)
 
     def create_textbox(self, parent, **kwargs):
         """Create a textbox with modern styling"""
-        if CTK_AVAILABLE:
-            return ctk.CTkTextbox(parent, **kwargs)
-        else:
-            text_widget = tk.Text(parent, **kwargs)
-            text_widget.configure(font=('Helvetica', 10))
-            return text_widget
+        return self._Text(parent, **kwargs)
 
     def create_header(self, parent):
         """Create the header section"""
@@ -179,28 +287,35 @@ class ModernSocialMediaGUI:
         list_frame = self.create_frame(left_panel)
         list_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
 
-        # Create scrollable frame
-        if CTK_AVAILABLE:
-            self.video_list_frame = ctk.CTkScrollableFrame(list_frame)
-            self.video_list_frame.pack(fill="both", expand=True)
-        else:
-            # Create scrollable frame with tkinter
-            canvas = tk.Canvas(list_frame, bg='white')
-            scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-            self.video_list_frame = ttk.Frame(canvas)
-
-            canvas.configure(yscrollcommand=scrollbar.set)
-            canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-            canvas.create_window((0, 0), window=self.video_list_frame, anchor="nw")
-
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-
-            # Mouse wheel binding
-            def on_mousewheel(event):
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-            canvas.bind("<MouseWheel>", on_mousewheel)
+        # Rows are tall enough to show the thumbnail in the tree column
+        style = ttk.Style()
+        style.configure('Video.Treeview', rowheight=THUMBNAIL_SIZE[1] + 6)
+
+        self.video_tree = ttk.Treeview(list_frame, columns=('title', 'status', 'platforms'),
+                                       show='tree headings', style='Video.Treeview')
+        self.video_tree.column('#0', width=THUMBNAIL_SIZE[0] + 10, stretch=False)
+        self.video_tree.heading('title', text="Title")
+        self.video_tree.column('title', width=160)
+        self.video_tree.heading('status', text="Status")
+        self.video_tree.column('status', width=90)
+        self.video_tree.heading('platforms', text="Platforms")
+        self.video_tree.column('platforms', width=120)
+
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.video_tree.yview)
+        self.video_tree.configure(yscrollcommand=scrollbar.set)
+
+        self.video_tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.video_tree.bind('<<TreeviewSelect>>', self.on_video_tree_select)
+
+        # Hint shown over the list while the queue is empty
+        self._empty_label = self.create_label(
+            list_frame,
+            "No videos in queue\nClick 'Add Videos' to start",
+            font=("Helvetica", 10) if not CTK_AVAILABLE else None
+        )
+        self.update_empty_hint()
 
     def create_video_editor_panel(self, parent):
         """Create the video editor panel"""
@@ -303,6 +418,10 @@ class ModernSocialMediaGUI:
             var = tk.BooleanVar(value=platform_id in video.get('platforms', []))
             self.platform_vars[platform_id] = var
 
+            # Write toggles straight into the video so saving needs no Tcl reads
+            var.trace_add('write', lambda *args, pid=platform_id, v=var:
+                          self._on_platform_toggle(video, pid, v.get()))
+
             if CTK_AVAILABLE:
                 checkbox = ctk.CTkCheckBox(platform_frame, text=platform_name, variable=var)
                 if platform_id == 'tiktok':
@@ -384,81 +503,185 @@ class ModernSocialMediaGUI:
                 ("All files", "*.*")
             ]
         )
+        if not files:
+            return
 
-        for file_path in files:
-            video = {
-                'id': len(self.videos) + 1,
-                'path': file_path,
-                'name': Path(file_path).name,
-                'title': Path(file_path).stem,
-                'description': '',
-                'tags': [],
-                'platforms': ['youtube'],
-                'privacy': 'public',
-                'status': 'pending'
-            }
-            self.videos.append(video)
-
-        self.refresh_video_list()
-        self.update_status(f"Added {len(files)} video(s)")
+        self._spawn(self._add_videos_async(files))
+
+    async def _add_videos_async(self, files):
+        """Hash the selected files in the worker pool and queue the new ones"""
+        self.update_status(f"Checking {len(files)} file(s)...")
+        hashes = await asyncio.gather(
+            *(self.loop.run_in_executor(self._thumb_pool, _fast_hash, f) for f in files),
+            return_exceptions=True
+        )
+
+        # Detach the list while inserting so Tk lays it out once at the end
+        pack_info = self.video_tree.pack_info()
+        self.video_tree.pack_forget()
+
+        added = 0
+        try:
+            for file_path, file_hash in zip(files, hashes):
+                if isinstance(file_hash, Exception):
+                    file_hash = None  # Unreadable now; queue it and let the upload report the error
+                elif file_hash in self._seen_hashes:
+                    continue
+                else:
+                    self._seen_hashes.add(file_hash)
+
+                video = {
+                    'id': next(self._video_ids),
+                    'path': file_path,
+                    'name': Path(file_path).name,
+                    'title': Path(file_path).stem,
+                    'description': '',
+                    'tags': [],
+                    'platforms': ['youtube'],
+                    'privacy': 'public',
+                    'status': 'pending',
+                    'progress': 0,
+                    'hash': file_hash
+                }
+                self.set_video_platforms(video, video['platforms'])
+                self.videos[video['id']] = video
+                self._pending.add(video['id'])
+                self.video_tree.insert('', 'end', iid=str(video['id']), values=self.video_row_values(video))
+                self.load_thumbnail(video)
+                added += 1
+        finally:
+            self.video_tree.pack(**pack_info)
+            self.update_empty_hint()
+
+        message = f"Added {added} video(s)"
+        if added < len(files):
+            message += f", skipped {len(files) - added} duplicate(s)"
+        self.update_status(message)
 
     def refresh_video_list(self):
         """Refresh the video list display"""
-        # Clear existing items
-        for widget in self.video_list_frame.winfo_children():
-            widget.destroy()
+        for video in self.videos.values():
+            self.video_tree.item(str(video['id']), values=self.video_row_values(video))
+        self.update_empty_hint()
+
+    def update_empty_hint(self):
+        """Show the empty queue hint only when there are no videos"""
+        if self.videos:
+            self._empty_label.place_forget()
+        else:
+            self._empty_label.place(in_=self.video_tree, relx=0.5, rely=0.5, anchor="center")
 
-        if not self.videos:
-            no_videos_label = self.create_label(
-                self.video_list_frame,
-                "No videos in queue\nClick 'Add Videos' to start",
-                font=("Helvetica", 10) if not CTK_AVAILABLE else None
-            )
-            no_videos_label.pack(pady=20)
+    def video_row_values(self, video):
+        """Build the column values shown for a video in the list"""
+        return (
+            video.get('title', video['name']),
+            video['status'].title(),
+            video['_platforms_display']
+        )
+
+    def set_video_platforms(self, video, platforms):
+        """Set the platforms of a video and cache their display text"""
+        video['platforms'] = platforms
+        video['_platforms_display'] = ", ".join([p.title() for p in platforms])
+
+    def on_video_tree_select(self, event):
+        """Open the focused video in the editor"""
+        video_id = self.video_tree.focus()
+        if video_id:
+            self.select_video(self.videos[int(video_id)])
+
+    def load_thumbnail(self, video):
+        """Load the video thumbnail from cache, or decode it in the worker pool"""
+        video_id = video['id']
+        try:
+            cache_path = self._thumb_cache_path(video['path'])
+        except OSError:
             return
 
-        # Create video items
-        for video in self.videos:
-            self.create_video_item(video)
+        # Cached PNGs are cheap to load, so do it right away on the Tk thread
+        if cache_path.exists():
+            from PIL import Image
 
-    def create_video_item(self, video):
-        """Create a video item in the list"""
-        item_frame = self.create_frame(self.video_list_frame)
-        item_frame.pack(fill="x", pady=5, padx=5)
+            try:
+                image = Image.open(cache_path)
+                image.load()
+            except (OSError, SyntaxError):
+                # Corrupt cache entry, drop it and decode again
+                cache_path.unlink(missing_ok=True)
+            else:
+                self._attach_thumb(video_id, image)
+                return
 
-        # Video info
-        info_frame = self.create_frame(item_frame)
-        info_frame.pack(fill="x", padx=10, pady=10)
+        self._spawn(self._create_thumb_async(video_id, video['path'], cache_path))
 
-        # Title
-        title_label = self.create_label(
-            info_frame,
-            video.get('title', video['name']),
-            font=("Helvetica", 10, "bold") if not CTK_AVAILABLE else None
-        )
-        title_label.pack(anchor="w")
-
-        # Status and platforms
-        status_text = f"Status: {video['status'].title()}"
-        if video.get('platforms'):
-            platforms_text = ", ".join([p.title() for p in video['platforms']])
-            status_text += f" | Platforms: {platforms_text}"
-
-        status_label = self.create_label(
-            info_frame,
-            status_text,
-            font=("Helvetica", 8) if not CTK_AVAILABLE else None
-        )
-        status_label.pack(anchor="w")
-
-        # Select button
-        select_btn = self.create_button(
-            info_frame,
-            "Edit",
-            command=lambda v=video: self.select_video(v),
-            width=80 if CTK_AVAILABLE else None
-        )
-        select_btn.pack(anchor="e", pady=2)
+    async def _create_thumb_async(self, video_id, path, cache_path):
+        """Decode a thumbnail in the worker pool and attach it when ready"""
+        try:
+            image = await self.loop.run_in_executor(self._thumb_pool, self._create_thumb, path, cache_path)
+        except Exception:
+            return  # Leave the row without a thumbnail
+        if image is not None:
+            self._attach_thumb(video_id, image)
+
+    def _thumb_cache_path(self, path):
+        """Cache file for a video thumbnail, keyed by path, modification time and size"""
+        stat = os.stat(path)
+        key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return THUMBNAIL_CACHE_DIR / f"{digest}.png"
+
+    def _create_thumb(self, path, cache_path):
+        """Decode a thumbnail and store it in the cache (runs in worker thread)"""
+        frame = self._decode_thumb(path)
+        if frame is None:
+            return None
+
+        from PIL import Image
+
+        image = Image.fromarray(frame)
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(cache_path, buffer.getvalue())
+        except OSError:
+            pass  # Caching is best effort
+        return image
+
+    def _decode_thumb(self, path):
+        """Read the middle frame of a video as a small RGB array (runs in worker thread)"""
+        import cv2
+
+        cap = cv2.VideoCapture(path)
+        try:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+            # Seek straight to the midpoint instead of decoding every frame up to it
+            frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            if frame_count > 0 and fps > 0:
+                cap.set(cv2.CAP_PROP_POS_MSEC, frame_count / fps * 1000 / 2)
+
+            ok, frame = cap.read()
+        finally:
+            cap.release()
+        if not ok:
+            return None
+
+        frame = cv2.resize(frame, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    def _attach_thumb(self, video_id, image):
+        """Show a thumbnail image in the video list"""
+        if video_id not in self.videos:
+            return  # Video was removed while decoding
+
+        # Keep a reference so the image is not garbage collected
+        from PIL import ImageTk
+
+        photo = ImageTk.PhotoImage(image)
+        self._thumb_images[video_id] = photo
+        self.video_tree.item(str(video_id), image=photo)
 
     def select_video(self, video):
         """Select a video for editing"""
@@ -480,7 +703,6 @@ class ModernSocialMediaGUI:
                 tags_text = self.tags_entry.get()
 
             tags = [tag.strip() for tag in tags_text.split(',') if tag.strip()]
-            platforms = [platform for platform, var in self.platform_vars.items() if var.get()]
             privacy = self.privacy_var.get()
 
             # Update video
@@ -488,7 +710,6 @@ class ModernSocialMediaGUI:
                 'title': title,
                 'description': description,
                 'tags': tags,
-                'platforms': platforms,
                 'privacy': privacy
             })
 
@@ -498,62 +719,170 @@ class ModernSocialMediaGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save changes: {str(e)}")
 
+    def _on_platform_toggle(self, video, platform_id, checked):
+        """Add or remove a platform on a video when its checkbox changes"""
+        platforms = [p for p in video['platforms'] if p != platform_id]
+        if checked:
+            platforms.append(platform_id)
+        self.set_video_platforms(video, platforms)
+        self.video_tree.item(str(video['id']), values=self.video_row_values(video))
+
     def remove_video(self, video):
         """Remove a video from the queue"""
         if messagebox.askyesno("Confirm", f"Remove '{video['name']}' from queue?"):
-            self.videos.remove(video)
-            self.refresh_video_list()
+            del self.videos[video['id']]
+            self._pending.discard(video['id'])
+            self._seen_hashes.discard(video['hash'])
+            self._thumb_images.pop(video['id'], None)
+            self.video_tree.delete(str(video['id']))
+            self.update_empty_hint()
             self.show_default_editor_message()
             self.update_status(f"Removed: {video['name']}")
 
+    def _spawn(self, coro):
+        """Start a task on the event loop, keeping a reference until it finishes"""
+        task = self.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task):
+        """Forget a finished task and report its exception, if any"""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            exc = task.exception()
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+    async def _cancel_tasks(self):
+        """Cancel uploads and thumbnail jobs still running on the event loop"""
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _shutdown(self):
+        """Stop background workers and close the window"""
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self.loop.run_until_complete(self._cancel_tasks())
+        self.loop.close()
+        self.root.destroy()
+
+    def _pump_loop(self):
+        """Run the asyncio loop for one time slice, then hand control back to Tk"""
+        busy = bool(self._tasks)
+
+        # Skip when re-entered from a nested Tk loop (e.g. a dialog opened by a coroutine)
+        if not self.loop.is_running():
+            if busy:
+                self.loop.call_later(LOOP_SLICE_MS / 1000, self.loop.stop)
+            else:
+                # Nothing to wait for, so only run callbacks that are already due
+                self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+        self.root.after(1 if busy else LOOP_IDLE_MS, self._pump_loop)
+
     def upload_single_video(self, video):
         """Upload a single video"""
+        if not self._queue_upload(video):
+            self.update_status(f"Already uploading: {video['name']}")
+            return
+        self._spawn(self._upload_async(video))
+
+    def _queue_upload(self, video):
+        """Mark a video as in flight, returning False if it already is"""
+        if video['id'] in self._active_uploads:
+            return False
+
+        self._pending.discard(video['id'])
+        video['progress'] = 0
+        self._active_uploads[video['id']] = video
+        self._progress_videos[video['id']] = video
+        self._start_progress_ticker()
+        return True
+
+    async def _upload_async(self, video):
+        """Upload a queued video, waiting for a free upload slot"""
+        try:
+            async with self._upload_sem:
+                await self._upload(video)
+        finally:
+            self._active_uploads.pop(video['id'], None)
 
-        def upload_thread():
-            try:
-                video['status'] = 'uploading'
-                self.refresh_video_list()
-                self.update_status(f"Uploading: {video['name']}")
-
-                # Simulate upload process
-                for i in range(101):
-                    time.sleep(0.05)
-                    if CTK_AVAILABLE:
-                        self.progress_bar.set(i / 100)
-                    else:
-                        self.progress_bar.configure(value=i)
-                    self.root.update_idletasks()
-
-                video['status'] = 'completed'
-                self.refresh_video_list()
-                self.update_status(f"Completed: {video['name']}")
-
-                if CTK_AVAILABLE:
-                    self.progress_bar.set(0)
-                else:
-                    self.progress_bar.configure(value=0)
+    async def _upload(self, video):
+        """Transfer a video and track its status"""
+        try:
+            video['status'] = 'uploading'
+            self.refresh_video_list()
+            self.update_status(f"Uploading: {video['name']}")
 
-            except Exception as e:
-                video['status'] = 'failed'
-                self.refresh_video_list()
-                messagebox.showerror("Upload Error", f"Failed to upload {video['name']}: {str(e)}")
+            # Simulate upload process by streaming the file
+            total = os.path.getsize(video['path']) or 1
+            sent = 0
+            async for chunk in self._stream(video['path']):
+                sent += len(chunk)
+                video['progress'] = sent / total
+                await asyncio.sleep(SIMULATED_UPLOAD_SECONDS * len(chunk) / total)
+
+            video['status'] = 'completed'
+            self.refresh_video_list()
+            self.update_status(f"Completed: {video['name']}")
+
+        except Exception as e:
+            video['status'] = 'failed'
+            self.refresh_video_list()
 
-        threading.Thread(target=upload_thread, daemon=True).start()
+            # Show the dialog from Tk, as it blocks in a nested event loop
+            message = f"Failed to upload {video['name']}: {str(e)}"
+            self.root.after(0, messagebox.showerror, "Upload Error", message)
 
     def upload_all_videos(self):
         """Upload all pending videos"""
-        pending_videos = [v for v in self.videos if v['status'] == 'pending']
-
-        if not pending_videos:
+        if not self._pending:
             messagebox.showinfo("Info", "No pending videos to upload")
             return
 
-        def upload_all_thread():
-            for video in pending_videos:
-                self.upload_single_video(video)
-                time.sleep(1)  # Delay between uploads
+        # Videos leave the pending set as soon as they are queued
+        pending_videos = [self.videos[video_id] for video_id in sorted(self._pending)]
+        pending_videos = [video for video in pending_videos if self._queue_upload(video)]
+        self._pending.clear()
+
+        self._spawn(self._upload_all_async(pending_videos))
+
+    async def _stream(self, path):
+        """Yield the contents of a file in UPLOAD_CHUNK_SIZE chunks"""
+        async with aiofiles.open(path, 'rb') as f:
+            while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+
+    async def _upload_all_async(self, videos):
+        """Upload videos concurrently"""
+        await asyncio.gather(*(self._upload_async(video) for video in videos))
+
+    def _start_progress_ticker(self):
+        """Start redrawing the progress bar unless it is already running"""
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.root.after(PROGRESS_INTERVAL_MS, self._tick_progress)
+
+    def _tick_progress(self):
+        """Redraw the progress bar from Tk's event loop until all uploads finish"""
+        if not self._active_uploads:
+            self._progress_videos.clear()
+            self._progress_scheduled = False
+            self.set_progress(0)
+            return
+
+        # Average over every video uploaded since the bar started, so it never jumps back
+        videos = self._progress_videos.values()
+        self.set_progress(sum(v['progress'] for v in videos) / len(videos))
+        self.root.after(PROGRESS_INTERVAL_MS, self._tick_progress)
 
-        threading.Thread(target=upload_all_thread, daemon=True).start()
+    def set_progress(self, fraction):
+        """Update progress bar (fraction between 0 and 1)"""
+        if CTK_AVAILABLE:
+            self.progress_bar.set(fraction)
+        else:
+            self.progress_bar.configure(value=fraction * 100)
 
     def show_settings(self):
         """Show settings dialog"""
@@ -632,31 +961,105 @@ class ModernSocialMediaGUI:
 
     def update_status(self, message):
         """Update status bar"""
-        if hasattr(self, 'status_label'):
-            if CTK_AVAILABLE:
-                self.status_label.configure(text=message)
-            else:
-                self.status_label.configure(text=message)
+        self._status_pending = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after(STATUS_INTERVAL_MS, self._flush_status)
+
+    def _flush_status(self):
+        """Apply the latest pending status message"""
+        message, self._status_pending = self._status_pending, None
+        self._status_scheduled = False
+        if message is not None and hasattr(self, 'status_label'):
+            self.status_label.configure(text=message)
 
     def load_config(self):
         """Load configuration from file"""
         try:
-            with open("gui_config.json", "r") as f:
-                config = json.load(f)
-                self.credentials.update(config.get('credentials', {}))
+            config = _loads(Path("gui_config.json").read_bytes())
         except FileNotFoundError:
-            pass
+            return
+        self.credentials.update(config.get('credentials', {}))
+
+        # Hash what the file holds, so a plaintext password from an older
+        # config is moved to the keyring on the next save
+        password_in_file = bool(self.credentials['instagram'].get('password'))
+        self._config_hash = hash(_dumps(self.build_config(password_in_keyring=not password_in_file)))
+
+        if self._keyring_usable and not password_in_file:
+            self.load_password()
+
+    def load_password(self):
+        """Load the Instagram password from the system keyring"""
+        username = self.credentials['instagram']['username']
+        if not username:
+            return
+        try:
+            password = keyring.get_password(KEYRING_SERVICE, username)
+        except KeyringError:
+            return
+        if password is not None:
+            self.credentials['instagram']['password'] = password
+            self._keyring_password = (username, password)
+
+    def save_password(self):
+        """Save the Instagram password to the system keyring, returning whether it is stored there"""
+        username = self.credentials['instagram']['username']
+        password = self.credentials['instagram']['password']
+        if (username, password) == self._keyring_password:
+            return True
+        if password and not username:
+            return False  # Keyring entries are keyed by username, keep it in the file
+
+        try:
+            if username and password:
+                keyring.set_password(KEYRING_SERVICE, username, password)
+
+            # Drop the entry of a previous username or a cleared password
+            old = self._keyring_password
+            if old is not None and (old[0] != username or not password):
+                try:
+                    keyring.delete_password(KEYRING_SERVICE, old[0])
+                except PasswordDeleteError:
+                    pass  # Already gone
+        except KeyringError as e:
+            self._keyring_usable = False
+            messagebox.showwarning(
+                "Warning",
+                f"System keyring unavailable, password is kept in gui_config.json: {str(e)}"
+            )
+            return False
+
+        self._keyring_password = (username, password) if username and password else None
+        return True
+
+    def build_config(self, password_in_keyring=False):
+        """Build the configuration dict that is persisted to file"""
+        credentials = self.credentials
+        if password_in_keyring:
+            # The password is kept in the keyring, not in the file
+            credentials = dict(credentials, instagram=dict(credentials['instagram'], password=''))
+        return {
+            'credentials': credentials
+        }
 
     def save_config(self):
         """Save configuration to file"""
-        config = {
-            'credentials': self.credentials
-        }
-        with open("gui_config.json", "w") as f:
-            json.dump(config, f, indent=4)
+        password_in_keyring = self._keyring_usable and self.save_password()
+        config = self.build_config(password_in_keyring)
+
+        # Skip the write when nothing changed since the last load/save
+        data = _dumps(config)
+        new_hash = hash(data)
+        if new_hash == self._config_hash:
+            return
+
+        _atomic_write("gui_config.json", data)
+        self._config_hash = new_hash
 
     def run(self):
         """Start the GUI application"""
+        self.root.after(0, self._pump_loop)
         self.root.mainloop()
 
 